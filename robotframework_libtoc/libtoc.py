@@ -1,15 +1,40 @@
 import argparse
+import concurrent.futures
+import contextlib
+import functools
 import glob
+import io
 import os
 import shutil
+import string
 import sys
 import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import importlib_resources
 import robot.libdoc
 
+_PACKAGE_DIR = os.path.dirname(__file__)
+_DEFAULT_TOC_TEMPLATE = os.path.join(_PACKAGE_DIR, "toc_template.html")
+_DEFAULT_HOMEPAGE_TEMPLATE = os.path.join(_PACKAGE_DIR, "homepage_template.html")
+
+_AS_SPLIT = re.compile(r"(.+?)\s{2,}(?:AS|WITH NAME)\s{2,}(.+)")
+_LINKS_MARKER = "\0links\0"
+# non empty lines, which are not comments - without leading and trailing whitespaces
+_CONFIG_LINE = re.compile(r"^\s*([^#\s].*?)\s*$", re.MULTILINE)
+_CONFIG_SECTION_MARKERS = {
+    "[paths]": "paths",
+    "[packages]": "packages",
+    "[libs]": "libs",
+    "[libraries]": "libs",
+}
+# the environment doesn't change during a run, so resolved lib strings can be reused
+_expandvars = functools.lru_cache(maxsize=None)(os.path.expandvars)
+# packages are shared by the configs of all resource dirs, so they are looked up only once
+_package_files = functools.lru_cache(maxsize=None)(importlib_resources.files)
+
 
 class LibdocException(Exception):
     def __init__(self, broken_file):
@@ -21,32 +46,40 @@ def toc(links, timestamp, home_page_path, template_file=""):
     Returns a HTML source code for TOC (table of contents) page, based on the template and including
     the provided `links`, generation `timestamp` and the `home_page_path` HTML file as a landing page.
     """
-    if template_file == "":
-        template_file = os.path.join(os.path.dirname(__file__), "toc_template.html")
-    with open(template_file, encoding="utf8") as f:
-        html_template = f.read()
+    toc_prefix, toc_suffix = _toc_parts(timestamp, home_page_path, template_file)
+    if toc_suffix is None:
+        return toc_prefix
+    return toc_prefix + links + toc_suffix
 
-    # double all brackets to make the further formatting work
-    html_with_escaped_braces = html_template.replace("{", "{{")
-    html_with_escaped_braces = html_with_escaped_braces.replace("}", "}}")
 
-    # and convert the formatting brackets back
-    html_with_escaped_braces = html_with_escaped_braces.replace("{{}}", "{}")
+def _toc_parts(timestamp, home_page_path, template_file=""):
+    """
+    Returns the HTML source code of the TOC page like `toc`, but split in the parts before and after the links,
+    so the links can be written in between without building the whole page in memory.
 
-    return html_with_escaped_braces.format(home_page_path, links, timestamp)
+    The second part is `None` if the template contains no links placeholder.
+    The links are only placed at the first placeholder, any further ones are removed.
+    """
+    template_file = template_file or _DEFAULT_TOC_TEMPLATE
+    html_template = Path(template_file).read_text(encoding="utf8")
+    html_with_links_marker = string.Template(html_template).safe_substitute(
+        home=home_page_path, links=_LINKS_MARKER, timestamp=timestamp
+    )
+    toc_prefix, links_marker, toc_suffix = html_with_links_marker.partition(
+        _LINKS_MARKER
+    )
+    if not links_marker:
+        return toc_prefix, None
+    return toc_prefix, toc_suffix.replace(_LINKS_MARKER, "")
 
 
 def homepage(timestamp, template_file=""):
     """
     Returns a HTML source code for a landing page, based on the template and includig the provided `timestamp`.
     """
-    if template_file == "":
-        template_file = os.path.join(
-            os.path.dirname(__file__), "homepage_template.html"
-        )
-    with open(template_file, encoding="utf_8") as f:
-        html_template = f.read()
-    return html_template.format(timestamp)
+    template_file = template_file or _DEFAULT_HOMEPAGE_TEMPLATE
+    html_template = Path(template_file).read_text(encoding="utf8")
+    return string.Template(html_template).safe_substitute(timestamp=timestamp)
 
 
 def read_config(config_file):
@@ -68,33 +101,18 @@ def read_config(config_file):
     SomeLibrary::some_import_param
     ```
     """
-    sections = {
-        "paths": {"markers": ["[paths]"], "values": []},
-        "packages": {"markers": ["[packages]"], "values": []},
-        "libs": {"markers": ["[libs]", "[libraries]"], "values": []},
-    }
-
-    with open(config_file, encoding="utf8") as f:
-        section_to_add = ""
-        lines = f.readlines()
-        for line in lines:
-            stripped_line = line.strip()
-            if len(stripped_line) > 0:
-                if not stripped_line.startswith("#"):  # comments
-                    skip_line = False
-                    for section_name, section_content in sections.items():
-                        if stripped_line.lower() in section_content["markers"]:
-                            section_to_add = section_name
-                            skip_line = True
-                            break
-                    if not skip_line and section_to_add:
-                        sections[section_to_add]["values"].append(stripped_line)
-
-    return {
-        "paths": sections["paths"]["values"],
-        "packages": sections["packages"]["values"],
-        "libs": sections["libs"]["values"],
-    }
+    values = {"paths": [], "packages": [], "libs": []}
+    section_values = None
+    config_text = Path(config_file).read_text(encoding="utf8")
+    for line in _CONFIG_LINE.finditer(config_text):
+        stripped_line = line[1]
+        section_name = _CONFIG_SECTION_MARKERS.get(stripped_line.lower())
+        if section_name:
+            section_values = values[section_name]
+        elif section_values is not None:
+            section_values.append(stripped_line)
+
+    return values
 
 
 def add_files_from_folder(folder, base_dir_path, root=True):
@@ -104,38 +122,417 @@ def add_files_from_folder(folder, base_dir_path, root=True):
 
     The `root` parameter is needed for internal usage only - it's set to False during deeper recursive calls.
     """
-    result_str = ""
+    return "".join(_emit_folder_links(folder, base_dir_path, root))
+
+
+def _emit_folder_links(folder, base_dir_path, root=True):
+    """
+    Yields the HTML fragments for `add_files_from_folder`, so they can be joined once
+    instead of being concatenated on every recursion level.
+    """
     if not root:  # means we're in the root - no collapsible need in this case
-        result_str += """<button class="collapsible">{}</button>
-        """.format(
-            os.path.basename(folder)
-        )
+        yield f"""<button class="collapsible">{os.path.basename(folder)}</button>
+        """
 
-        result_str += """<div class="collapsible_content">
+        yield """<div class="collapsible_content">
         """
 
-    for item in os.listdir(folder):
-        item_path = os.path.abspath(os.path.join(folder, item))
-        if item.endswith(".html"):
-            name_without_ext = os.path.splitext(item)[0]
-            result_str += """<a class="link_not_selected" href="{}" target="targetFrame">{}</a>
-            """.format(
-                os.path.relpath(item_path, base_dir_path), name_without_ext
-            )
-        else:
-            if os.path.isdir(item_path):
-                result_str += add_files_from_folder(
-                    item_path, base_dir_path, root=False
-                )
+    # a single scandir provides the entry type without an extra stat() per item
+    with os.scandir(os.path.abspath(folder)) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.name.endswith(".html"):
+            name_without_ext = os.path.splitext(entry.name)[0]
+            href = os.path.relpath(entry.path, base_dir_path)
+            yield f"""<a class="link_not_selected" href="{href}" target="targetFrame">{name_without_ext}</a>
+            """
+        elif entry.is_dir():
+            yield from _emit_folder_links(entry.path, base_dir_path, root=False)
 
     if not root:
         # end of the "collapsible_content"
-        result_str += """</div>
+        yield """</div>
+    """
+
+
+def _glob_to_regex(path_pattern):
+    """
+    Translates a glob `path_pattern` into a regex matching relative paths separated by `/`.
+
+    Follows the rules of `glob.glob(..., recursive=True)`: `**` matches any number of folders,
+    other wildcards don't cross folder boundaries and hidden names only match an explicit leading dot.
+    """
+    components = path_pattern.replace(os.sep, "/").split("/")
+    regex_parts = []
+    for index, component in enumerate(components):
+        is_last = index == len(components) - 1
+        if component == "**":
+            regex_parts.append(r"(?:(?!\.)[^/]+/)*" + (r"(?!\.)[^/]+" if is_last else ""))
+            continue
+        regex_parts.append(_glob_component_to_regex(component) + ("" if is_last else "/"))
+    return "".join(regex_parts)
+
+
+def _glob_component_to_regex(component):
+    """
+    Translates a single path `component` of a glob pattern into a regex, see `_glob_to_regex`.
+    """
+    regex = [] if component.startswith(".") else [r"(?!\.)"]
+    i, n = 0, len(component)
+    while i < n:
+        char = component[i]
+        i += 1
+        if char == "*":
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+        elif char == "[":
+            j = i
+            if j < n and component[j] == "!":
+                j += 1
+            if j < n and component[j] == "]":
+                j += 1
+            j = component.find("]", j)
+            if j < 0:
+                regex.append(r"\[")
+            else:
+                regex.append(_glob_char_set_to_regex(component[i:j]))
+                i = j + 1
+        else:
+            regex.append(re.escape(char))
+    return "".join(regex)
+
+
+def _glob_char_set_to_regex(char_set):
+    """
+    Translates the content of a glob `[...]` character set into a regex, like `fnmatch.translate()` does -
+    but a negated set doesn't match `/`, so it can't cross folder boundaries.
+    Reversed ranges like `b-a` are empty, so they are removed - like in `fnmatch.translate()`.
+    """
+    negated = char_set.startswith("!")
+    if negated:
+        char_set = char_set[1:]
+    # split in chunks around the range dashes, a leading "-" or "]" is a literal character
+    chunks = []
+    start = 0
+    k = 1
+    while True:
+        k = char_set.find("-", k)
+        if k < 0:
+            break
+        chunks.append(char_set[start:k])
+        start = k + 1
+        k = k + 3
+    chunk = char_set[start:]
+    if chunk:
+        chunks.append(chunk)
+    else:
+        chunks[-1] += "-"
+    # merge the chunks around empty ranges - they are invalid in a regex
+    for k in range(len(chunks) - 1, 0, -1):
+        if chunks[k - 1] and chunks[k] and chunks[k - 1][-1] > chunks[k][0]:
+            chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+            del chunks[k]
+    regex_set = "-".join(
+        re.sub(r"([\\\[\]&~|^-])", r"\\\1", chunk) for chunk in chunks
+    )
+    if negated:
+        return f"[^/{regex_set}]"
+    if not regex_set:
+        return "(?!)"  # an empty set never matches
+    return f"[{regex_set}]"
+
+
+def _walk_files(folder, relative_dir="", descend=None):
+    """
+    Yields `(relative_dir, file_entries)` for the `folder` and all it's subfolders,
+    where `file_entries` are the `os.DirEntry` objects of the files directly inside the folder.
+    The relative folder paths use `/` as separator, end with it (if not empty) and are prefixed with the `relative_dir`.
+
+    Only subfolders, for which `descend(depth, name)` returns true, are walked - `depth` is the index
+    of the subfolder in its relative path. All subfolders are walked if no `descend` function is given.
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:  # not existing or not readable folders are skipped - like glob does
+        return
+
+    file_entries = []
+    sub_folders = []
+    for entry in entries:
+        if entry.is_dir():
+            sub_folders.append(entry)
+        else:
+            file_entries.append(entry)
+    yield relative_dir, file_entries
+    depth = relative_dir.count("/")
+    for entry in sub_folders:
+        if descend is None or descend(depth, entry.name):
+            yield from _walk_files(entry.path, relative_dir + entry.name + "/", descend)
+
+
+def _walk_filter(path_patterns):
+    """
+    Returns a function `descend(depth, name)` for `_walk_files`, which tells if files matching any of the glob
+    `path_patterns` (separated by `/`) can be in the subfolder `name` at the `depth`.
+
+    Without `**` in the patterns the walk stops below their deepest folder level. Like glob, hidden folders are only
+    walked if a pattern has a component with an explicit leading dot at their level - or anywhere after a `**`.
+    """
+    max_depth = 0
+    hidden_depths = set()
+    hidden_from_depth = None
+    for path_pattern in path_patterns:
+        components = path_pattern.split("/")
+        recursive_index = components.index("**") if "**" in components else None
+        if recursive_index is None:
+            if max_depth is not None:
+                max_depth = max(max_depth, len(components) - 1)
+        else:
+            max_depth = None
+        for index, component in enumerate(components[:-1]):
+            if not component.startswith("."):
+                continue
+            if recursive_index is not None and index > recursive_index:
+                if hidden_from_depth is None or recursive_index < hidden_from_depth:
+                    hidden_from_depth = recursive_index
+            else:
+                hidden_depths.add(index)
+
+    def descend(depth, name):
+        if max_depth is not None and depth >= max_depth:
+            return False
+        if name.startswith("."):
+            return depth in hidden_depths or (
+                hidden_from_depth is not None and depth >= hidden_from_depth
+            )
+        return True
+
+    return descend
+
+
+def _split_glob(path_pattern):
+    """
+    Splits the glob `path_pattern` in the leading folders without wildcards and the remaining pattern.
+    Both parts use `/` as separator, the remaining pattern is empty if the whole `path_pattern` has no wildcards.
+    """
+    components = path_pattern.replace(os.sep, "/").split("/")
+    for index, component in enumerate(components):
+        if glob.has_magic(component):
+            return "/".join(components[:index]), "/".join(components[index:])
+    return "/".join(components), ""
+
+
+def _find_walk_root(walk_roots, path):
+    """
+    Returns the folder from the `walk_roots`, which contains the `path` - or `None` if there is no such folder.
+    """
+    for walk_root in walk_roots:
+        if walk_root == "" or path.startswith(walk_root + "/"):
+            return walk_root
+    return None
+
+
+def _find_resource_files(resource_dir, path_patterns):
+    """
+    Yields `(real_path, relative_path)` for all files in the `resource_dir` matching any of the glob `path_patterns`.
+
+    Patterns without wildcards are checked directly, files found this way are skipped in the walks. For the others only the folders given by their leading parts
+    without wildcards are walked - once for all patterns and each file is matched against them with one combined regex,
+    instead of resolving every pattern separately with `glob.glob()`. The walks don't go deeper than the patterns
+    can match and skip hidden folders like glob does, see `_walk_filter`.
+    Patterns pointing outside of the `resource_dir` (absolute or containing `.`/`..`) are still resolved with `glob.glob()`.
     """
-    return result_str
+    literal_paths = []
+    walk_patterns = {}
+    name_patterns = []
+    for path_pattern in path_patterns:
+        components = path_pattern.replace(os.sep, "/").split("/")
+        if os.path.isabs(path_pattern) or "." in components or ".." in components:
+            resource_dir_prefix = os.path.join(resource_dir, "")
+            for real_path in glob.glob(
+                os.path.join(resource_dir, path_pattern), recursive=True
+            ):
+                if not os.path.isfile(real_path):
+                    continue
+                if real_path.startswith(resource_dir_prefix):
+                    relative_path = real_path[len(resource_dir_prefix):]
+                else:
+                    relative_path = os.path.relpath(real_path, resource_dir)
+                yield real_path, relative_path
+            continue
+        # like glob, repeated separators are ignored - only a trailing one restricts the match to folders
+        components = [component for component in components[:-1] if component] + components[-1:]
+        path_pattern = "/".join(components)
+        if (
+            len(components) == 2
+            and components[0] == "**"
+            and components[1] not in ("", "**")
+        ):
+            # "**/name" patterns only need to check the file names
+            name_patterns.append(path_pattern)
+            walk_patterns.setdefault("", [])
+            continue
+        literal_prefix, remainder = _split_glob(path_pattern)
+        if remainder:
+            walk_patterns.setdefault(literal_prefix, []).append(path_pattern)
+        else:
+            literal_paths.append(literal_prefix)
+
+    # folders inside of other walked folders are covered by the outer walk
+    walk_roots = {}
+    for literal_prefix in sorted(walk_patterns, key=len):
+        walk_root = _find_walk_root(walk_roots, literal_prefix)
+        if walk_root is None:
+            walk_root = literal_prefix
+        walk_roots.setdefault(walk_root, []).extend(walk_patterns[literal_prefix])
+
+    # literal paths are checked directly - adding them to the walks would make them deeper
+    found_literal_paths = set()
+    for literal_path in dict.fromkeys(literal_paths):
+        real_path = os.path.join(resource_dir, literal_path)
+        if os.path.isfile(real_path):
+            relative_path = literal_path.replace("/", os.sep)
+            found_literal_paths.add(os.path.normcase(relative_path))
+            yield real_path, relative_path
+
+    for walk_root, root_patterns in walk_roots.items():
+        # a single alternation matches each file against all patterns at once
+        path_regex = _combine_regexes(
+            [_glob_to_regex(path_pattern) for path_pattern in root_patterns]
+        )
+        if walk_root:
+            walked_folders = _walk_files(
+                os.path.join(resource_dir, walk_root),
+                walk_root + "/",
+                _walk_filter(root_patterns),
+            )
+            name_regex = None
+        else:
+            walked_folders = _walk_files(
+                resource_dir, descend=_walk_filter(root_patterns + name_patterns)
+            )
+            name_regex = _combine_regexes(
+                [
+                    _glob_component_to_regex(path_pattern[len("**/"):])
+                    for path_pattern in name_patterns
+                ]
+            )
+        for relative_dir, file_entries in walked_folders:
+            # like glob, "**" doesn't match hidden folders
+            match_names = name_regex is not None and "/." not in "/" + relative_dir
+            for entry in file_entries:
+                if (match_names and name_regex.fullmatch(entry.name)) or (
+                    path_regex is not None
+                    and path_regex.fullmatch(relative_dir + entry.name)
+                ):
+                    relative_path = (relative_dir + entry.name).replace("/", os.sep)
+                    if os.path.normcase(relative_path) not in found_literal_paths:
+                        yield entry.path, relative_path
+
+
+def _combine_regexes(regexes):
+    """
+    Returns a single compiled regex matching any of the `regexes` - or `None` if there are no `regexes`.
+    Matching is case insensitive on platforms with case insensitive paths - like glob does.
+    """
+    if not regexes:
+        return None
+    return re.compile(
+        "|".join(f"(?:{regex})" for regex in regexes),
+        re.IGNORECASE if os.path.normcase("A") == "a" else 0,
+    )
 
 
-def create_docs_for_dir(resource_dir, output_dir, config_file):
+def _init_libdoc_worker(python_path):
+    """
+    Makes the `python_path` of the main process available in a libdoc worker process.
+    """
+    sys.path[:] = python_path
+
+
+def _libdoc(library_or_resource, target_path, name=None):
+    return robot.libdoc.libdoc(library_or_resource, target_path, name, quiet=True)
+
+
+def _libdoc_in_worker(library_or_resource, target_path, name=None):
+    """
+    Runs `_libdoc` in a worker process and returns its return code together with the console output it has written.
+
+    Robot Framework writes its errors directly to the original stdout/stderr, so the output is captured on the level
+    of file descriptors - this way it can be printed along with the progress message of the call in the main process.
+    """
+    with tempfile.TemporaryFile() as output:
+        saved_fds = [os.dup(1), os.dup(2)]
+        try:
+            os.dup2(output.fileno(), 1)
+            os.dup2(output.fileno(), 2)
+            return_code = _libdoc(library_or_resource, target_path, name)
+        finally:
+            for stream in (sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__):
+                if stream is not None:
+                    stream.flush()
+            for fd, saved_fd in zip((1, 2), saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+        output.seek(0)
+        encoding = getattr(sys.__stderr__, "encoding", None) or "utf-8"
+        return return_code, output.read().decode(encoding, errors="replace")
+
+
+def _run_libdoc(libdoc_calls, executor=None):
+    """
+    Generates the docs for all `libdoc_calls` - tuples `(item, progress_message, library_or_resource, target_path, name)` -
+    and returns the items, which the docs generation failed for.
+
+    The calls are distributed among the processes of the `executor`, if provided - otherwise they are run one by one.
+    The `progress_message` of each call is printed when it's run or - with an `executor` - when its result is collected,
+    in both cases in the order of the `libdoc_calls` and followed by the errors libdoc reported for the call.
+    """
+    # flush the progress of the current step before libdoc reports any errors
+    sys.stdout.flush()
+    return_codes = []
+    if executor is None:
+        for call in libdoc_calls:
+            print(call[1])
+            # libdoc errors should follow the progress message of their call
+            sys.stdout.flush()
+            return_codes.append(_libdoc(*call[2:]))
+    else:
+        futures = [executor.submit(_libdoc_in_worker, *call[2:]) for call in libdoc_calls]
+        try:
+            for call, future in zip(libdoc_calls, futures):
+                return_code, output = future.result()
+                return_codes.append(return_code)
+                print(call[1])
+                if output:
+                    sys.stdout.flush()
+                    sys.stderr.write(output)
+                    sys.stderr.flush()
+        except BaseException:
+            # e.g. on Ctrl+C don't wait for the queued calls when the executor is shut down
+            for future in futures:
+                future.cancel()
+            raise
+        sys.stdout.flush()
+    return [
+        call[0]
+        for call, return_code in zip(libdoc_calls, return_codes)
+        if return_code > 0
+    ]
+
+
+def create_docs_for_dir(
+    resource_dir,
+    output_dir,
+    config_file,
+    executor=None,
+    broken_files=None,
+    broken_packages=None,
+    broken_libs=None,
+):
     """
     Creates HTML docs using Robot Framework module `libdoc` for all resources and libraries in the `resource_dir`.
     Generated files are placed inside the `output_dir`, keeping the original subfolder tree structure.
@@ -153,7 +550,18 @@ def create_docs_for_dir(resource_dir, output_dir, config_file):
     SeleniumLibrary
     SomeLibrary::some_import_param
     ```
+
+    The `libdoc` calls are run in parallel by the processes of the `executor`, if provided.
+
+    Returns the lists of broken files, packages and libs. If the `broken_files`, `broken_packages` or `broken_libs`
+    lists are provided, the broken items are appended to them and they are returned.
     """
+    if broken_files is None:
+        broken_files = []
+    if broken_packages is None:
+        broken_packages = []
+    if broken_libs is None:
+        broken_libs = []
     target_dir = os.path.join(
         os.path.abspath(output_dir), os.path.basename(resource_dir)
     )
@@ -162,25 +570,26 @@ def create_docs_for_dir(resource_dir, output_dir, config_file):
     resource_path_patterns = doc_config["paths"]
     if resource_path_patterns:
         print(">> Processing paths")
-    broken_files = []
-    for path_pattern in resource_path_patterns:
-        for real_path in glob.glob(
-            os.path.join(resource_dir, path_pattern), recursive=True
-        ):
-            relative_path = os.path.relpath(real_path, resource_dir)
-            target_path = os.path.join(
-                target_dir, relative_path.rpartition(".")[0] + ".html"
+    libdoc_calls = []
+    for real_path, relative_path in _find_resource_files(
+        resource_dir, resource_path_patterns
+    ):
+        target_path = f"{target_dir}{os.sep}{relative_path.rpartition('.')[0]}.html"
+        libdoc_calls.append(
+            (
+                relative_path,
+                f">>> Processing file: {relative_path}",
+                real_path,
+                target_path,
+                None,
             )
-            print(f">>> Processing file: {relative_path}")
-            return_code = robot.libdoc.libdoc(real_path, target_path, quiet=True)
-            if return_code > 0:
-                broken_files.append(relative_path)
+        )
+    broken_files.extend(_run_libdoc(libdoc_calls, executor))
 
     package_definitions = doc_config["packages"]
     if package_definitions:
         print("---")
     packages = {}
-    broken_packages = []
     for package_definition in package_definitions:
         package_name, path_pattern = package_definition.split(":", 1)
         if package_name not in packages:
@@ -190,38 +599,50 @@ def create_docs_for_dir(resource_dir, output_dir, config_file):
     for package_name, paths_patterns in packages.items():
         print(f">> Processing package: {package_name}")
         try:
-            package_anchor = importlib_resources.files(package_name)
+            package_anchor = _package_files(package_name)
         except ModuleNotFoundError as e:
             print(f"Importing package '{package_name}' failed: {e}")
             broken_packages.append(package_name)
         else:
-            with importlib_resources.as_file(package_anchor) as package_path:
-                for path_pattern in paths_patterns:
-                    package_resource_files = package_path.glob(path_pattern)
-                    for real_path in package_resource_files:
-                        relative_path = Path(package_name) / real_path.relative_to(
-                            package_path
-                        )
-                        target_path = os.path.join(
-                            target_dir, relative_path.with_suffix(".html")
-                        )
-                        print(f">>> Processing file: {relative_path}")
-                        return_code = robot.libdoc.libdoc(
-                            real_path, target_path, quiet=True
+            if isinstance(package_anchor, Path) and package_anchor.exists():
+                # an installed package folder is used directly, as_file() is only needed for e.g. zipped packages
+                package_path_context = contextlib.nullcontext(package_anchor)
+            else:
+                package_path_context = importlib_resources.as_file(package_anchor)
+            with package_path_context as package_path:
+                libdoc_calls = []
+                for real_path, package_relative_path in _find_resource_files(
+                    str(package_path), paths_patterns
+                ):
+                    relative_path = Path(package_name) / package_relative_path
+                    target_path = (
+                        f"{target_dir}{os.sep}{relative_path.with_suffix('.html')}"
+                    )
+                    libdoc_calls.append(
+                        (
+                            relative_path,
+                            f">>> Processing file: {relative_path}",
+                            real_path,
+                            target_path,
+                            None,
                         )
-                        if return_code > 0:
-                            broken_packages.append(relative_path)
+                    )
+                # the docs must be generated before a temporary package_path is removed
+                broken_packages.extend(_run_libdoc(libdoc_calls, executor))
 
     libs = doc_config["libs"]
     if libs:
         print("---")
         print(">> Processing libraries")
-    broken_libs = []
-    as_split = re.compile(r'(.+)\s{2,}(?:AS|WITH NAME)\s{2,}(.+?)')
+    libdoc_calls = []
     for lib in libs:
-        lib_str_with_resolved_vars = os.path.expandvars(lib)
-        print(f">>> Processing lib: {lib_str_with_resolved_vars}")
-        renamed = as_split.fullmatch(lib_str_with_resolved_vars)
+        lib_str_with_resolved_vars = _expandvars(lib)
+        progress_message = f">>> Processing lib: {lib_str_with_resolved_vars}"
+        # most libs are not renamed - a substring check is enough to skip the regex for them
+        renamed = (
+            "AS" in lib_str_with_resolved_vars
+            or "WITH NAME" in lib_str_with_resolved_vars
+        ) and _AS_SPLIT.fullmatch(lib_str_with_resolved_vars)
         if renamed:
             lib_str_with_resolved_vars = renamed[1]
             name = os.path.basename(renamed[2])
@@ -233,12 +654,16 @@ def create_docs_for_dir(resource_dir, output_dir, config_file):
             target_path = os.path.join(
                 target_dir, lib_str_with_resolved_vars.partition("::")[0] + ".html"
             )
-        return_code = robot.libdoc.libdoc(
-            lib_str_with_resolved_vars, target_path,
-            name, quiet=True
+        libdoc_calls.append(
+            (
+                lib_str_with_resolved_vars,
+                progress_message,
+                lib_str_with_resolved_vars,
+                target_path,
+                name,
+            )
         )
-        if return_code > 0:
-            broken_libs.append(lib_str_with_resolved_vars)
+    broken_libs.extend(_run_libdoc(libdoc_calls, executor))
     return broken_files, broken_packages, broken_libs
 
 
@@ -261,32 +686,34 @@ def create_toc(
     # move all subfolders and files into "src"
     src_subdir = os.path.join(html_docs_dir, "src")
     os.makedirs(src_subdir, exist_ok=True)
-    all_docs = os.listdir(html_docs_dir)
+    with os.scandir(html_docs_dir) as it:
+        all_docs = [doc_element for doc_element in it if doc_element.name != "src"]
+    # "src" is on the same file system, so a plain rename is enough
     for doc_element in all_docs:
-        if doc_element == "src":
-            continue
-        src = os.path.join(html_docs_dir, doc_element)
-        target = os.path.join(src_subdir, doc_element)
-        shutil.move(src, target)
+        os.replace(doc_element.path, os.path.join(src_subdir, doc_element.name))
 
-    # create homepage in "src"
     homepage_path = os.path.join(src_subdir, homepage_file)
     current_date_time = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-    doc_files_links = add_files_from_folder(src_subdir, os.path.abspath(html_docs_dir))
-    with open(homepage_path, "w", encoding="utf8") as f:
-        f.write(homepage(current_date_time, homepage_template))
 
-    # create TOC
+    # create TOC - before the homepage, which should not be linked in it
     toc_file_path = os.path.join(html_docs_dir, toc_file)
+    toc_prefix, toc_suffix = _toc_parts(
+        current_date_time,
+        os.path.relpath(homepage_path, os.path.abspath(html_docs_dir)),
+        toc_template,
+    )
     with open(toc_file_path, "w", encoding="utf8") as f:
-        f.write(
-            toc(
-                doc_files_links,
-                current_date_time,
-                os.path.relpath(homepage_path, os.path.abspath(html_docs_dir)),
-                toc_template,
+        # the links are streamed into the file instead of being joined in memory first
+        f.write(toc_prefix)
+        if toc_suffix is not None:
+            f.writelines(
+                _emit_folder_links(src_subdir, os.path.abspath(html_docs_dir))
             )
-        )
+            f.write(toc_suffix)
+
+    # create homepage in "src"
+    with open(homepage_path, "w", encoding="utf8") as f:
+        f.write(homepage(current_date_time, homepage_template))
 
     print("---")
     print("TOC finished. Output file: {}".format(os.path.abspath(toc_file_path)))
@@ -324,11 +751,35 @@ def main():
         default="",
         help="Additional locations where to search for libraries and resources similarly as when running tests",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes generating the docs in parallel, defaults to the number of CPUs. Use 1 to disable parallel docs generation",
+    )
+
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print the progress line by line immediately, instead of once per processing step. "
+        "Only makes a difference for parallel runs - with '-j 1' each line is printed before its libdoc call anyway",
+    )
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("argument -j/--jobs: must be at least 1")
 
     if args.pythonpath:
         sys.path.insert(0, args.pythonpath)
+    _expandvars.cache_clear()
+    _package_files.cache_clear()
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        # changes the global stdout for the rest of the process, which is fine for the CLI:
+        # with --progress every line is written immediately - also if piped e.g. into a CI log,
+        # otherwise the progress is flushed once per processing step - except for serial runs,
+        # which flush each progress line before its libdoc call in any case
+        sys.stdout.reconfigure(line_buffering=args.progress)
 
     if os.path.isdir(args.output_dir):
         print(f"Output dir already exists, deleting it: {args.output_dir}")
@@ -337,38 +788,48 @@ def main():
     total_broken_packages = []
     total_broken_libs = []
 
-    for resources_dir in args.resources_dirs:
-        print("")
-        print(f"> Creating docs for dir: {os.path.abspath(resources_dir)}")
-        for child_element in os.listdir(resources_dir):
-            child_element_path = os.path.join(resources_dir, child_element)
-            current_broken_files = []
-            current_broken_packages = []
-            current_broken_libs = []
-            if os.path.isdir(child_element_path):
-                config_file = os.path.join(child_element_path, args.config_file)
-                if os.path.isfile(config_file):
-                    (
-                        current_broken_files,
-                        current_broken_packages,
-                        current_broken_libs,
-                    ) = create_docs_for_dir(
-                        child_element_path,
-                        args.output_dir,
-                        os.path.abspath(config_file),
-                    )
-            elif child_element == args.config_file:
-                current_broken_files, current_broken_packages, current_broken_libs = (
+    abs_output_dir = os.path.abspath(args.output_dir)
+    executor = None
+    if args.jobs != 1:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=_init_libdoc_worker,
+            initargs=(sys.path,),
+        )
+    try:
+        for resources_dir in args.resources_dirs:
+            print("")
+            print(f"> Creating docs for dir: {os.path.abspath(resources_dir)}")
+            # the cached DirEntry type saves a stat() per child element
+            with os.scandir(resources_dir) as it:
+                child_elements = list(it)
+            for child_element in child_elements:
+                if child_element.is_dir():
+                    # the only stat() needed per subfolder - to find its config file
+                    config_file = os.path.join(child_element.path, args.config_file)
+                    if os.path.isfile(config_file):
+                        create_docs_for_dir(
+                            child_element.path,
+                            abs_output_dir,
+                            os.path.abspath(config_file),
+                            executor,
+                            total_broken_files,
+                            total_broken_packages,
+                            total_broken_libs,
+                        )
+                elif child_element.name == args.config_file and child_element.is_file():
                     create_docs_for_dir(
                         resources_dir,
-                        args.output_dir,
-                        os.path.abspath(os.path.join(resources_dir, args.config_file)),
+                        abs_output_dir,
+                        os.path.abspath(child_element.path),
+                        executor,
+                        total_broken_files,
+                        total_broken_packages,
+                        total_broken_libs,
                     )
-                )
-
-            total_broken_files += current_broken_files
-            total_broken_packages += current_broken_packages
-            total_broken_libs += current_broken_libs
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     if total_broken_files:
         print("")
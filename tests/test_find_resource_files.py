@@ -0,0 +1,185 @@
+import glob
+import os
+
+import pytest
+
+from robotframework_libtoc import libtoc
+
+TREE_FILES = [
+    "top.robot",
+    "Upper.ROBOT",
+    ".hidden.robot",
+    "a/a.robot",
+    "a/b/b.robot",
+    "a/b/ab1.py",
+    "a/b/k.py",
+    "a/b/c/deep.robot",
+    "a/b/.h/q.robot",
+    "a/.venv/lib/v.py",
+    ".git/objects/o.robot",
+    ".git/c.robot",
+    "c/[x].py",
+    "c/sub/y.resource",
+    "d/e/f/g/far.resource",
+    "r/a.py",
+    "r/z.py",
+    "r/-.py",
+]
+
+PATTERNS = [
+    # wildcards, without "**"
+    "*.robot",
+    "*.ROBOT",
+    "a/*",
+    "*/*",
+    "a/b/*",
+    "a/?/*.py",
+    "c/*/*.resource",
+    # "**" as first, middle and last component
+    "**",
+    "**/",
+    "**/*.robot",
+    "**/*.resource",
+    "**/**",
+    "a/**",
+    "a/**/*.py",
+    "d/**/g/*.resource",
+    "**/b/**",
+    # hidden files and folders
+    ".*",
+    "**/.*",
+    "**/.h/*",
+    "a/**/.h/*",
+    ".git/*",
+    ".*/*",
+    ".git/**",
+    "*/.venv/*/*",
+    # character classes
+    "**/[a-k]*.py",
+    "**/[!a]*.py",
+    "c/[[]x].py",
+    "r/[a-]*",
+    "a[!x]b/*",
+    # empty (reversed) ranges
+    "r/[z-a].py",
+    "r/[b-a]*",
+    "r/[!b-a]*",
+    # literal paths
+    "top.robot",
+    "a/b/k.py",
+    "a/b/.h/q.robot",
+    "a/b",
+    "missing.robot",
+    "missing/*",
+    # empty components
+    "a//*.robot",
+    "a//b/k.py",
+    "[ab]*//b.robot",
+    "a//**/*.py",
+    "**//*.resource",
+    "a/b//",
+]
+
+OVERLAPPING_PATTERNS = [
+    ["*.robot", "**/*.robot"],
+    ["a/*.robot", "*.robot", "a/b/k.py"],
+    ["a/b/*", "a/**", "a/b/k.py"],
+    ["a/*.robot", "a/b/c/deep.robot", "a/b/c/*.robot"],
+    ["**/*.robot", "Upper.ROBOT", "a//a.robot"],
+    ["**/*.py", "**/[!a]*.py", "c/[[]x].py"],
+    ["top.robot", "*.robot", "top.robot"],
+    ["**/.h/*", "a/b/.h/q.robot", "**/*.robot"],
+    ["d/e/*/*/*.resource", "d/**", "c/*/*.resource"],
+]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for file in TREE_FILES:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return str(tmp_path)
+
+
+def glob_files(tree, path_patterns):
+    return sorted(
+        {
+            os.path.relpath(real_path, tree)
+            for path_pattern in path_patterns
+            for real_path in glob.glob(os.path.join(tree, path_pattern), recursive=True)
+            if os.path.isfile(real_path)
+        }
+    )
+
+
+def found_files(tree, path_patterns):
+    relative_paths = [
+        relative_path
+        for _, relative_path in libtoc._find_resource_files(tree, path_patterns)
+    ]
+    assert len(relative_paths) == len(set(relative_paths)), "files found twice"
+    return sorted(relative_paths)
+
+
+@pytest.mark.parametrize("path_pattern", PATTERNS)
+def test_single_pattern_matches_glob(tree, path_pattern):
+    assert found_files(tree, [path_pattern]) == glob_files(tree, [path_pattern])
+
+
+@pytest.mark.parametrize("path_patterns", OVERLAPPING_PATTERNS)
+def test_overlapping_patterns_match_glob(tree, path_patterns):
+    assert found_files(tree, path_patterns) == glob_files(tree, path_patterns)
+
+
+def test_real_paths_point_to_found_files(tree):
+    for real_path, relative_path in libtoc._find_resource_files(tree, ["**"]):
+        assert real_path == os.path.join(tree, relative_path)
+
+
+def test_patterns_outside_of_resource_dir(tree):
+    absolute_pattern = os.path.join(tree, "c", "sub", "*.resource")
+    resource_dir = os.path.join(tree, "a")
+    assert [
+        real_path
+        for real_path, _ in libtoc._find_resource_files(
+            resource_dir, [absolute_pattern, "../c/*.py"]
+        )
+    ] == glob.glob(absolute_pattern) + glob.glob(os.path.join(resource_dir, "../c/*.py"))
+
+
+def test_patterns_outside_of_resource_dir_yield_only_files(tree):
+    resource_dir = os.path.join(tree, "a")
+    assert [
+        relative_path
+        for _, relative_path in libtoc._find_resource_files(resource_dir, ["../c/*"])
+    ] == [os.path.join("..", "c", "[x].py")]
+
+
+def test_top_level_pattern_lists_only_resource_dir(tree, monkeypatch):
+    scanned = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    found_files(tree, ["*.robot"])
+    assert scanned == [tree]
+
+
+def test_literal_paths_do_not_deepen_walks(tree, monkeypatch):
+    scanned = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    assert found_files(tree, ["a/*.robot", "a/b/c/deep.robot"]) == [
+        os.path.join("a", "a.robot"),
+        os.path.join("a", "b", "c", "deep.robot"),
+    ]
+    assert scanned == [os.path.join(tree, "a")]